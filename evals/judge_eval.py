@@ -8,8 +8,12 @@ so it doesn't add latency to the user-facing response.
 On failure, triggers an escalation callback (Slack, PagerDuty, CRM, etc.).
 """
 
+import atexit
+import copy
 import logging
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -19,6 +23,36 @@ from agno.models.base import Model
 
 logger = logging.getLogger("intent_governance.evals")
 
+# Prefer orjson for payload encoding when installed (C encoder); encoding
+# ourselves also lets httpx send the bytes as-is instead of re-serializing.
+try:
+    import orjson
+
+    def _json_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def _json_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Attachment colors indexed by (score < 5): warning amber, then alert red.
+_COLORS = ("#fca103", "#eb4034")
+
+# Slack blocks that carry no per-alert data, shared across payloads.
+_DIVIDER_BLOCK = {"type": "divider"}
+_FOOTER_BLOCK = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "_Full audit trail available in local logs._",
+    },
+}
+
 
 # ── default escalation callback ─────────────────────────────────────────────
 
@@ -37,11 +71,27 @@ class SlackEscalationHook:
     Sends governance escalation alerts to a Slack channel via Incoming Webhook.
     """
 
+    #: Post attempts per alert (with exponential backoff between them).
+    MAX_ATTEMPTS = 3
+
     def __init__(self, webhook_url: Optional[str] = None):
         self.webhook_url = webhook_url or os.getenv("SLACK_WEBHOOK_URL")
         if not self.webhook_url:
             logger.warning("SlackEscalationHook initialized without a webhook URL.")
 
+        # One persistent client per hook: keeps the TLS connection to
+        # Slack warm between alerts instead of paying DNS + handshake on
+        # every post.
+        self._client = httpx.Client(
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+        )
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
     def __call__(self, result) -> None:
         """
         Executes the escalation by posting to Slack.
@@ -51,11 +101,16 @@ class SlackEscalationHook:
             default_escalation_hook(result)
             return
 
-        # Prepare the Slack payload using blocks for rich formatting
-        score_color = "#eb4034" if result.score < 5 else "#fca103"
-        
+        # Prepare the Slack payload — the dynamic fields are resolved once
+        # into locals; the divider and footer blocks are shared.  Binary
+        # (fast_mode) verdicts carry no numeric score, only pass/fail.
+        score = result.score
+        score_color = _COLORS[score is None or score < 5]
+        score_text = f"{score}/10" if score is not None else "FAIL"
+        judge_name = getattr(result, "name", None) or "Intent Check"
+
         payload = {
-            "text": f"🚨 *Intent Governance Escalation Required* (Score: {result.score}/10)",
+            "text": f"🚨 *Intent Governance Escalation Required* (Score: {score_text})",
             "attachments": [
                 {
                     "color": score_color,
@@ -64,14 +119,14 @@ class SlackEscalationHook:
                             "type": "section",
                             "text": {
                                 "type": "mrkdwn",
-                                "text": f"*Governance Alert: Intent Alignment Failure*\n*Score:* {result.score}/10 | *Passed:* {result.passed}"
+                                "text": f"*Governance Alert: Intent Alignment Failure*\n*Score:* {score_text} | *Passed:* {result.passed}"
                             }
                         },
                         {
                             "type": "section",
                             "fields": [
                                 {"type": "mrkdwn", "text": f"*Input:*\n{result.input[:100]}..."},
-                                {"type": "mrkdwn", "text": f"*Judge Name:*\n{getattr(result, 'name', 'Intent Check')}"}
+                                {"type": "mrkdwn", "text": f"*Judge Name:*\n{judge_name}"}
                             ]
                         },
                         {
@@ -81,38 +136,49 @@ class SlackEscalationHook:
                                 "text": f"*Reasoning:*\n{result.reason}"
                             }
                         },
-                        {
-                            "type": "divider"
-                        },
-                        {
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": "_Full audit trail available in local logs._"
-                            }
-                        }
+                        _DIVIDER_BLOCK,
+                        _FOOTER_BLOCK,
                     ]
                 }
             ]
         }
+        body = _json_bytes(payload)
 
-        try:
-            response = httpx.post(self.webhook_url, json=payload, timeout=10.0)
-            response.raise_for_status()
-            logger.info("[SLACK] Escalation alert sent successfully.")
-        except Exception as exc:
-            logger.error("[SLACK] Failed to send escalation alert: %s", exc)
-            default_escalation_hook(result)
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                response = self._client.post(
+                    self.webhook_url, content=body, headers=_JSON_HEADERS
+                )
+                response.raise_for_status()
+                logger.info("[SLACK] Escalation alert sent successfully.")
+                return
+            except Exception as exc:
+                if attempt + 1 < self.MAX_ATTEMPTS:
+                    time.sleep(0.5 * (2 ** attempt))
+                    continue
+                logger.error("[SLACK] Failed to send escalation alert: %s", exc)
+                default_escalation_hook(result)
 
 
 # ── factory ──────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=16)
+def _read_criteria(path_str: str, mtime_ns: int) -> str:
+    """Read a criteria file, cached by path and mtime.
+
+    Criteria files are stable between judge creations, so repeated
+    factory calls (benchmark loops, threshold sweeps) skip the file read.
+    """
+    return Path(path_str).read_text(encoding="utf-8").strip()
+
+
 def create_intent_judge(
     criteria_path: str | Path,
     model: Model,
     escalation_hook: Optional[Callable] = None,
     threshold: int = 7,
     run_in_background: bool = True,
+    fast_mode: bool = False,
 ) -> AgentAsJudgeEval:
     """
     Build an ``AgentAsJudgeEval`` instance configured for intent alignment.
@@ -131,30 +197,64 @@ def create_intent_judge(
     run_in_background : bool
         If True, the eval fires asynchronously so it does not block the
         agent's response latency.  Default True.
+    fast_mode : bool
+        If True, use binary pass/fail scoring at temperature 0 instead
+        of the numeric 1-10 scale.  Judge latency is near-linear in
+        output tokens, so dropping the score calibration and long
+        reasoning tail cuts both latency and output-token cost.
+        Default False.
 
     Returns
     -------
     AgentAsJudgeEval
     """
-    criteria_path = Path(criteria_path)
-    criteria_text = criteria_path.read_text(encoding="utf-8").strip()
+    if not isinstance(criteria_path, Path):
+        criteria_path = Path(criteria_path)
+    criteria_text = _read_criteria(str(criteria_path), criteria_path.stat().st_mtime_ns)
 
     hook = escalation_hook or default_escalation_hook
 
-    evaluation = AgentAsJudgeEval(
-        name="Intent Alignment Check",
-        criteria=criteria_text,
-        scoring_strategy="numeric",
-        threshold=threshold,
-        on_fail=hook,
-        run_in_background=run_in_background,
-        model=model,
-    )
+    if fast_mode:
+        # Binary scoring is the supported fast path: the judge decodes a
+        # short structured pass/fail verdict instead of a calibrated
+        # score plus prose.  Token-count clamps are not applied — the
+        # eval's structured output schema still needs valid JSON.
+        # Deterministic decoding is configured on a copy, because
+        # get_model() memoizes instances and the user-facing agent may
+        # share this one.
+        if hasattr(model, "temperature"):
+            model = copy.copy(model)
+            model.temperature = 0
+
+        evaluation = AgentAsJudgeEval(
+            name="Intent Alignment Check",
+            criteria=criteria_text,
+            scoring_strategy="binary",
+            threshold=threshold,
+            on_fail=hook,
+            run_in_background=run_in_background,
+            # Evals run on the governor's background worker; a Rich Live
+            # spinner there would interleave with the interactive prompt.
+            show_spinner=False,
+            model=model,
+        )
+    else:
+        evaluation = AgentAsJudgeEval(
+            name="Intent Alignment Check",
+            criteria=criteria_text,
+            scoring_strategy="numeric",
+            threshold=threshold,
+            on_fail=hook,
+            run_in_background=run_in_background,
+            show_spinner=False,
+            model=model,
+        )
 
     logger.info(
-        "Intent judge created — threshold=%d, background=%s, criteria_file=%s, model=%s",
+        "Intent judge created — threshold=%d, background=%s, fast_mode=%s, criteria_file=%s, model=%s",
         threshold,
         run_in_background,
+        fast_mode,
         criteria_path.name,
         type(model).__name__,
     )
@@ -22,19 +22,35 @@ Usage
     )
 """
 
+import hashlib
 import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Callable, Dict, Optional
 
 from agno.agent import Agent
 from agno.models.base import Model
 
-from hooks.constitution_hook import create_constitution_hook, logger_hook
+from hooks.constitution_hook import create_audited_constitution_hook
 from evals.judge_eval import create_intent_judge, default_escalation_hook
 from intent.retriever import create_intent_retriever
 
 logger = logging.getLogger("intent_governance.governor")
 
+# Posted on the judge queue to tell the worker thread to exit.
+_QUEUE_SENTINEL = object()
+
+# Maximum number of cached judge verdicts (LRU-evicted beyond this).
+_JUDGE_CACHE_MAX = 1024
+
+# Micro-batching: the worker collects up to this many queued turns within
+# the window before invoking the judge once for all of them.
+_JUDGE_BATCH_MAX = 8
+_JUDGE_BATCH_WINDOW = 0.050  # seconds
+
 
 class IntentGovernor:
     """
@@ -75,8 +91,12 @@ class IntentGovernor:
         judge_threshold: int = 7,
         judge_background: bool = True,
     ):
-        self.constitution_path = Path(constitution)
-        self.judge_criteria_path = Path(judge_criteria)
+        self.constitution_path = (
+            constitution if isinstance(constitution, Path) else Path(constitution)
+        )
+        self.judge_criteria_path = (
+            judge_criteria if isinstance(judge_criteria, Path) else Path(judge_criteria)
+        )
         self.escalation_hook = escalation_hook or default_escalation_hook
         self.base_intent = base_intent
         self.strategy_overrides = strategy_overrides
@@ -84,7 +104,11 @@ class IntentGovernor:
         self.judge_background = judge_background
 
         # ── pre-build components ─────────────────────────────────────────
-        self._constitution_hook = create_constitution_hook(self.constitution_path)
+        # One fused hook does both the audit log and the constitution
+        # check — a single wrapper frame per tool call.
+        self._constitution_hook = create_audited_constitution_hook(
+            self.constitution_path
+        )
         self._intent_retriever = create_intent_retriever(
             base_intent=self.base_intent,
             strategy_overrides=self.strategy_overrides,
@@ -101,6 +125,31 @@ class IntentGovernor:
             self._judge = None
             logger.warning("IntentGovernor initialised without a judge model.")
 
+        # ── judge verdict cache ──────────────────────────────────────────
+        # Identical (input, output) turns — common in demo loops and
+        # regression runs — short-circuit to the cached verdict instead of
+        # paying a second judge API call.  Keyed by a blake2b digest over
+        # criteria + input + output so a criteria-file change invalidates.
+        if judge_model:
+            self._criteria_hash = hashlib.blake2b(
+                self.judge_criteria_path.read_bytes(), digest_size=16
+            ).digest()
+        else:
+            self._criteria_hash = b""
+        self._judge_cache: "OrderedDict[bytes, object]" = OrderedDict()
+        self._judge_cache_lock = threading.Lock()
+
+        # ── background judge worker ──────────────────────────────────────
+        # Evaluations run on a daemon thread fed by a bounded queue so the
+        # user-facing loop never waits on judge latency.  When the queue is
+        # full we drop (and count) rather than block the caller.
+        self._judge_queue: queue.Queue = queue.Queue(maxsize=256)
+        self._judge_dropped = 0
+        self._judge_thread = threading.Thread(
+            target=self._judge_worker, name="intent-judge-worker", daemon=True
+        )
+        self._judge_thread.start()
+
         logger.info(
             "IntentGovernor initialised — constitution=%s, criteria=%s",
             self.constitution_path,
@@ -115,12 +164,12 @@ class IntentGovernor:
         return it for chaining convenience.
 
         Modifications:
-            - ``agent.tool_hooks`` ← [logger_hook, constitution_hook]
+            - ``agent.tool_hooks`` ← [fused audit + constitution hook]
             - ``agent.instructions`` ← callable intent retriever
         """
-        # 1. Inject tool hooks (logger outermost, constitution innermost)
+        # 1. Inject the fused audit + constitution hook
         existing_hooks = list(agent.tool_hooks or [])
-        agent.tool_hooks = [logger_hook, self._constitution_hook] + existing_hooks
+        agent.tool_hooks = [self._constitution_hook] + existing_hooks
 
         # 2. Replace instructions with callable retriever
         agent.instructions = self._intent_retriever
@@ -130,24 +179,100 @@ class IntentGovernor:
 
     # ── post-run evaluation ──────────────────────────────────────────────
 
-    def evaluate_response(self, input_text: str, output_text: str):
+    def evaluate_response(self, input_text: str, output_text: str) -> None:
         """
-        Run the AgentAsJudgeEval against a completed agent turn.
+        Queue an AgentAsJudgeEval run for a completed agent turn.
 
         Call this after each ``agent.run()`` to score the response against
-        brand-voice and ethics criteria.
-
-        Returns the eval result (or None if running in background mode).
+        brand-voice and ethics criteria.  The evaluation is fire-and-forget:
+        it executes on the background worker, and failures surface through
+        the escalation hook rather than a return value.
         """
+        if self._judge is None:
+            return
+
+        cache_key = hashlib.blake2b(
+            self._criteria_hash
+            + input_text.encode()
+            + b"\x00"
+            + output_text.encode(),
+            digest_size=16,
+        ).digest()
+        with self._judge_cache_lock:
+            if cache_key in self._judge_cache:
+                self._judge_cache.move_to_end(cache_key)
+                logger.debug("Judge cache hit — evaluation skipped.")
+                return
+
         try:
-            result = self._judge.run(
-                input=input_text,
-                output=output_text,
+            self._judge_queue.put_nowait(
+                (cache_key, {"input": input_text, "output": output_text})
+            )
+        except queue.Full:
+            self._judge_dropped += 1
+            logger.warning(
+                "Judge queue full — evaluation dropped (%d dropped so far).",
+                self._judge_dropped,
             )
-            return result
+
+    def _judge_worker(self) -> None:
+        """Drain the judge queue on a daemon thread, micro-batching turns.
+
+        After the first item arrives, the worker collects up to
+        ``_JUDGE_BATCH_MAX`` further items within ``_JUDGE_BATCH_WINDOW``
+        and submits them as a single multi-case judge run, amortizing the
+        per-call API overhead across the batch.
+        """
+        while True:
+            item = self._judge_queue.get()
+            if item is _QUEUE_SENTINEL:
+                self._judge_queue.task_done()
+                return
+
+            batch = [item]
+            shutting_down = False
+            deadline = time.monotonic() + _JUDGE_BATCH_WINDOW
+            while len(batch) < _JUDGE_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = self._judge_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nxt is _QUEUE_SENTINEL:
+                    shutting_down = True
+                    break
+                batch.append(nxt)
+
+            self._run_judge_batch(batch)
+            for _ in range(len(batch) + shutting_down):
+                self._judge_queue.task_done()
+            if shutting_down:
+                return
+
+    def _run_judge_batch(self, batch) -> None:
+        """Score a micro-batch of queued turns with one judge invocation."""
+        try:
+            if len(batch) == 1:
+                result = self._judge.run(**batch[0][1])
+            else:
+                result = self._judge.run(
+                    cases=[payload for _, payload in batch]
+                )
+            if result is not None:
+                with self._judge_cache_lock:
+                    for cache_key, _ in batch:
+                        self._judge_cache[cache_key] = result
+                    while len(self._judge_cache) > _JUDGE_CACHE_MAX:
+                        self._judge_cache.popitem(last=False)
         except Exception as exc:
             logger.error("Judge eval failed: %s", exc)
-            return None
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the background judge worker, draining queued evaluations."""
+        self._judge_queue.put(_QUEUE_SENTINEL)
+        self._judge_thread.join(timeout=timeout)
 
     # ── convenience properties ───────────────────────────────────────────
 
@@ -1,4 +1,12 @@
 # hooks/__init__.py
-from .constitution_hook import create_constitution_hook, logger_hook
+from .constitution_hook import (
+    create_audited_constitution_hook,
+    create_constitution_hook,
+    logger_hook,
+)
 
-__all__ = ["create_constitution_hook", "logger_hook"]
+__all__ = [
+    "create_audited_constitution_hook",
+    "create_constitution_hook",
+    "logger_hook",
+]
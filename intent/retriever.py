@@ -10,6 +10,7 @@ redeployment required to shift strategy.
 """
 
 import logging
+from functools import lru_cache
 from typing import Callable, Dict, Optional
 
 logger = logging.getLogger("intent_governance.intent")
@@ -61,33 +62,45 @@ def create_intent_retriever(
     -------
     Callable[[dict], str]
     """
+    # Merged once at factory time; the per-call path is a single
+    # strategies.get(org_goal) with no branching on goal names.
     strategies = {**DEFAULT_STRATEGIES, **(strategy_overrides or {})}
 
-    def intent_retriever(session_state: dict) -> str:
-        org_goal = session_state.get("org_goal", "")
-        customer_tier = session_state.get("customer_tier", "standard")
-
-        instructions = base_intent
-
-        # Inject tier awareness
-        instructions += f"\n\nThe current customer's tier is: {customer_tier}."
-
-        # Inject quarterly strategy
+    # Assembled instructions are memoized per (org_goal, customer_tier).
+    # The retriever fires on every turn but its inputs have tiny
+    # cardinality (goals × tiers), so the steady state is one cache hit.
+    # base_intent and strategies live in the closure, so they aren't part
+    # of the key.
+    @lru_cache(maxsize=64)
+    def _build(org_goal: str, customer_tier: str) -> str:
         strategy_suffix = strategies.get(org_goal, "")
-        if strategy_suffix:
-            instructions += strategy_suffix
-            logger.info(
-                "[INTENT RETRIEVER] org_goal=%s, tier=%s — strategy injected.",
-                org_goal,
-                customer_tier,
-            )
-        else:
-            logger.info(
-                "[INTENT RETRIEVER] org_goal=%s (no override), tier=%s.",
-                org_goal,
-                customer_tier,
-            )
+
+        # Base prompt + tier awareness + quarterly strategy, in one pass
+        instructions = (
+            f"{base_intent}\n\nThe current customer's tier is: "
+            f"{customer_tier}.{strategy_suffix}"
+        )
+
+        if logger.isEnabledFor(logging.INFO):
+            if strategy_suffix:
+                logger.info(
+                    "[INTENT RETRIEVER] org_goal=%s, tier=%s — strategy injected.",
+                    org_goal,
+                    customer_tier,
+                )
+            else:
+                logger.info(
+                    "[INTENT RETRIEVER] org_goal=%s (no override), tier=%s.",
+                    org_goal,
+                    customer_tier,
+                )
 
         return instructions
 
+    def intent_retriever(session_state: dict) -> str:
+        return _build(
+            session_state.get("org_goal", ""),
+            session_state.get("customer_tier", "standard"),
+        )
+
     return intent_retriever
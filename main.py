@@ -14,6 +14,7 @@ Usage
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -22,6 +23,7 @@ from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.markdown import Markdown
+from rich.text import Text
 
 # ── ensure project root is on sys.path ───────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parent
@@ -30,6 +32,15 @@ sys.path.insert(0, str(PROJECT_ROOT))
 # ── env & logging ────────────────────────────────────────────────────────────
 load_dotenv(PROJECT_ROOT / ".env")
 
+# Env and path constants, resolved once at import — this is the whole env
+# contract of the demo.
+_AGENT_PROVIDER = os.getenv("AGENT_PROVIDER", "perplexity")
+_JUDGE_PROVIDER = os.getenv("JUDGE_PROVIDER", "perplexity")
+_SLACK_WEBHOOK = os.getenv("SLACK_WEBHOOK_URL")
+_API_KEY = os.getenv("PERPLEXITY_API_KEY")
+_CONSTITUTION_PATH = PROJECT_ROOT / "constitutions" / "acme_corp.yaml"
+_CRITERIA_PATH = PROJECT_ROOT / "criteria" / "brand_voice.txt"
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(message)s",
@@ -65,21 +76,16 @@ SESSION_STATE = {
 def build_agent() -> tuple[Agent, IntentGovernor]:
     """Create and wrap an agent with the full Intent Governance Layer."""
 
-    # Select providers from environment
-    agent_provider = os.getenv("AGENT_PROVIDER", "perplexity")
-    judge_provider = os.getenv("JUDGE_PROVIDER", "perplexity")
-
     # Instantiate models via factory
-    agent_model = get_model(provider=agent_provider)
-    judge_model = get_model(provider=judge_provider)
+    agent_model = get_model(provider=_AGENT_PROVIDER)
+    judge_model = get_model(provider=_JUDGE_PROVIDER)
 
     # Create Slack hook if URL is provided
-    slack_webhook = os.getenv("SLACK_WEBHOOK_URL")
-    escalation_hook = SlackEscalationHook(slack_webhook) if slack_webhook else None
+    escalation_hook = SlackEscalationHook(_SLACK_WEBHOOK) if _SLACK_WEBHOOK else None
 
     governor = IntentGovernor(
-        constitution=PROJECT_ROOT / "constitutions" / "acme_corp.yaml",
-        judge_criteria=PROJECT_ROOT / "criteria" / "brand_voice.txt",
+        constitution=_CONSTITUTION_PATH,
+        judge_criteria=_CRITERIA_PATH,
         judge_model=judge_model,
         escalation_hook=escalation_hook,
         base_intent=(
@@ -103,6 +109,22 @@ def build_agent() -> tuple[Agent, IntentGovernor]:
 # Interactive loop
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Characters whose presence suggests a response actually uses Markdown.
+_MD_CHARS = "*_`#>["
+
+
+@lru_cache(maxsize=64)
+def _render_response(content: str):
+    """Return a Rich renderable for an agent response, cached per content.
+
+    Plain-text responses skip the Markdown parser entirely, and repeated
+    responses (re-demos, regression runs) reuse the parsed renderable.
+    """
+    if not any(c in content for c in _MD_CHARS):
+        return Text(content)
+    return Markdown(content)
+
+
 def handle_confirmation(run_response, agent) -> object:
     """
     If the run is paused (requires_confirmation), prompt the human
@@ -148,8 +170,7 @@ def handle_confirmation(run_response, agent) -> object:
 def main():
     """Entry point for the interactive CLI demo."""
 
-    api_key = os.getenv("PERPLEXITY_API_KEY")
-    if not api_key or api_key.startswith("pplx-xxx"):
+    if not _API_KEY or _API_KEY.startswith("pplx-xxx"):
         console.print(
             Panel(
                 "[bold red]Missing PERPLEXITY_API_KEY[/]\n\n"
@@ -203,7 +224,7 @@ def main():
             content = str(run_response.content) if run_response.content else "(no response)"
             console.print(
                 Panel(
-                    Markdown(content),
+                    _render_response(content),
                     title="🤖 Agent",
                     border_style="green",
                 )
@@ -228,6 +249,8 @@ def main():
             console.print(f"[bold red]Error:[/] {exc}")
             logger.exception("Unhandled error")
 
+    governor.shutdown()
+
 
 if __name__ == "__main__":
     main()
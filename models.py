@@ -1,21 +1,32 @@
-import os
-from typing import Optional
-from agno.models.base import Model
-from agno.models.openai import OpenAIChat
-from agno.models.anthropic import Anthropic
-from agno.models.perplexity import Perplexity
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-def get_model(provider: str = "perplexity", model_id: Optional[str] = None) -> Model:
+if TYPE_CHECKING:
+    from agno.models.base import Model
+
+
+def get_model(provider: str = "perplexity", model_id: Optional[str] = None) -> "Model":
     """
     Factory to create an Agno model instance based on provider name.
+
+    Vendor SDKs are imported lazily inside each branch so startup only
+    pays the import cost of the provider actually in use, and instances
+    are memoized per (provider, model_id) so repeated calls (agent +
+    judge on the same provider) share one model and its HTTP client.
     """
-    provider = provider.lower()
-    
+    return _create_model(provider.lower(), model_id)
+
+
+@lru_cache(maxsize=8)
+def _create_model(provider: str, model_id: Optional[str]) -> "Model":
     if provider == "openai":
+        from agno.models.openai import OpenAIChat
         return OpenAIChat(id=model_id or "gpt-4o")
     elif provider == "anthropic":
+        from agno.models.anthropic import Anthropic
         return Anthropic(id=model_id or "claude-3-5-sonnet-20240620")
     elif provider == "perplexity":
+        from agno.models.perplexity import Perplexity
         return Perplexity(id=model_id or "sonar-pro")
     else:
         raise ValueError(f"Unsupported provider: {provider}")
@@ -1,27 +1,55 @@
 """
 Unit tests for the Intent Governance Layer.
 Run with:  python -m pytest tests/ -v
+
+The fixtures are stateless (session-scoped, immutable dict rules), so
+the suite also runs in parallel:  python -m pytest tests/ -n auto
 """
 
+import re
 import sys
+import types
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
-import yaml
 
 # Ensure project root is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from evals.judge_eval import SlackEscalationHook  # noqa: E402
+from hooks.constitution_hook import (  # noqa: E402
+    create_audited_constitution_hook,
+    create_constitution_hook,
+)
+from intent.retriever import create_intent_retriever  # noqa: E402
+
+# Compiled once; pytest.raises(match=...) would recompile it per check.
+INTENT_BLOCK_RE = re.compile("Intent Block")
+
+
+def make_counting(ret):
+    """Return (fn, calls) — a stub that counts invocations and returns *ret*.
+
+    A plain closure with an integer cell; avoids MagicMock's call-history
+    bookkeeping on the hot test path.
+    """
+    calls = [0]
+
+    def fn(**_):
+        calls[0] += 1
+        return ret
+
+    return fn, calls
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Fixtures
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@pytest.fixture
-def constitution_path(tmp_path):
-    """Write a test constitution and return its path."""
-    rules = {
+@pytest.fixture(scope="session")
+def constitution_rules():
+    """In-memory test constitution — no YAML round-trip through disk."""
+    return {
         "stripe_refund": [
             {
                 "condition": "high_value",
@@ -43,118 +71,141 @@ def constitution_path(tmp_path):
             },
         ],
     }
-    path = tmp_path / "test_constitution.yaml"
-    path.write_text(yaml.dump(rules), encoding="utf-8")
-    return path
-
 
-@pytest.fixture
-def mock_run_context_standard():
-    """RunContext stub with customer_tier=standard."""
-    ctx = MagicMock()
-    ctx.session_state = {"customer_tier": "standard"}
-    return ctx
 
+@pytest.fixture(
+    scope="session",
+    params=[create_constitution_hook, create_audited_constitution_hook],
+    ids=["layered", "fused"],
+)
+def constitution_hook(request, constitution_rules):
+    """Build each constitution hook flavour once per session.
 
-@pytest.fixture
-def mock_run_context_enterprise():
-    """RunContext stub with customer_tier=enterprise."""
-    ctx = MagicMock()
-    ctx.session_state = {"customer_tier": "enterprise"}
-    return ctx
+    Covers both the standalone hook and the fused audit + constitution
+    hook that ``IntentGovernor.wrap`` actually installs.
+    """
+    return request.param(constitution_rules)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Layer 1 — Constitution Hook
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class TestConstitutionHook:
-    """Test the constitution hook factory."""
+# (function_name, customer_tier, arguments, expected) — "raises" marks the
+# Intent Block path; anything else is the value the wrapped call returns.
+HOOK_CASES = [
+    ("stripe_refund", "standard", {"customer_id": "C-1", "amount": 500}, "raises"),
+    ("stripe_refund", "enterprise", {"customer_id": "C-1", "amount": 500}, "refund_ok"),
+    ("stripe_refund", "standard", {"customer_id": "C-1", "amount": 50}, "small_refund_ok"),
+    ("unknown_tool", "standard", {}, "unknown_ok"),
+    ("send_email", "standard", {"to": "a@b.com", "subject": "Hi", "body": "Hello"}, "email_sent"),
+]
 
-    def test_reject_high_value_standard_user(
-        self, constitution_path, mock_run_context_standard
-    ):
-        from hooks.constitution_hook import create_constitution_hook
 
-        hook = create_constitution_hook(constitution_path)
-        mock_fn = MagicMock(return_value="ok")
+class TestConstitutionHook:
+    """Test the constitution hook factory."""
 
-        with pytest.raises(ValueError, match="Intent Block"):
-            hook(
-                run_context=mock_run_context_standard,
-                function_name="stripe_refund",
+    @pytest.mark.parametrize("fn_name,tier,args,expected", HOOK_CASES)
+    def test_hook_behavior(self, constitution_hook, fn_name, tier, args, expected):
+        # The hook only reads session_state — a plain namespace avoids
+        # MagicMock's __getattr__ machinery on every access.
+        ctx = types.SimpleNamespace(session_state={"customer_tier": tier})
+        mock_fn, calls = make_counting("ok" if expected == "raises" else expected)
+
+        if expected == "raises":
+            with pytest.raises(ValueError) as excinfo:
+                constitution_hook(
+                    run_context=ctx,
+                    function_name=fn_name,
+                    function_call=mock_fn,
+                    arguments=args,
+                )
+            assert INTENT_BLOCK_RE.search(str(excinfo.value))
+            assert calls[0] == 0
+        else:
+            result = constitution_hook(
+                run_context=ctx,
+                function_name=fn_name,
                 function_call=mock_fn,
-                arguments={"customer_id": "C-1", "amount": 500},
+                arguments=args,
             )
-        mock_fn.assert_not_called()
+            assert result == expected
+            assert calls[0] == 1
+
+    def test_fused_hook_audits_blocked_calls(self, constitution_rules, caplog):
+        # The fused hook emits its audit line in a finally, so calls the
+        # constitution rejects still leave a trace.
+        hook = create_audited_constitution_hook(constitution_rules)
+        ctx = types.SimpleNamespace(session_state={"customer_tier": "standard"})
+        mock_fn, calls = make_counting("ok")
+
+        with caplog.at_level("INFO", logger="intent_governance.hooks"):
+            with pytest.raises(ValueError):
+                hook(
+                    run_context=ctx,
+                    function_name="stripe_refund",
+                    function_call=mock_fn,
+                    arguments={"customer_id": "C-1", "amount": 500},
+                )
+
+        assert calls[0] == 0
+        audit_lines = [r.getMessage() for r in caplog.records if "[AUDIT]" in r.getMessage()]
+        assert len(audit_lines) == 1
+        assert "blocked" in audit_lines[0]
 
-    def test_approve_high_value_enterprise_user(
-        self, constitution_path, mock_run_context_enterprise
-    ):
-        from hooks.constitution_hook import create_constitution_hook
 
-        hook = create_constitution_hook(constitution_path)
-        mock_fn = MagicMock(return_value="refund_ok")
+# ═══════════════════════════════════════════════════════════════════════════════
+# Layer 2 — Slack Escalation Hook
+# ═══════════════════════════════════════════════════════════════════════════════
 
-        result = hook(
-            run_context=mock_run_context_enterprise,
-            function_name="stripe_refund",
-            function_call=mock_fn,
-            arguments={"customer_id": "C-1", "amount": 500},
+class TestSlackEscalationHook:
+    """Test escalation payload construction."""
+
+    @staticmethod
+    def _make_hook(monkeypatch):
+        """Build a hook whose client captures payloads instead of posting."""
+        hook = SlackEscalationHook(webhook_url="https://hooks.slack.invalid/T0/B0/x")
+        sent = []
+
+        def fake_post(url, content=None, headers=None):
+            sent.append(content)
+            return types.SimpleNamespace(raise_for_status=lambda: None)
+
+        monkeypatch.setattr(hook._client, "post", fake_post)
+        return hook, sent
+
+    def test_numeric_score_payload(self, monkeypatch):
+        hook, sent = self._make_hook(monkeypatch)
+        result = types.SimpleNamespace(
+            score=3,
+            passed=False,
+            input="Refund $500 for C-1",
+            reason="Tone violates brand voice.",
+            name="Intent Alignment Check",
         )
-        assert result == "refund_ok"
-        mock_fn.assert_called_once()
-
-    def test_approve_low_value_standard_user(
-        self, constitution_path, mock_run_context_standard
-    ):
-        from hooks.constitution_hook import create_constitution_hook
-
-        hook = create_constitution_hook(constitution_path)
-        mock_fn = MagicMock(return_value="small_refund_ok")
-
-        result = hook(
-            run_context=mock_run_context_standard,
-            function_name="stripe_refund",
-            function_call=mock_fn,
-            arguments={"customer_id": "C-1", "amount": 50},
-        )
-        assert result == "small_refund_ok"
-        mock_fn.assert_called_once()
-
-    def test_approve_unknown_tool(
-        self, constitution_path, mock_run_context_standard
-    ):
-        from hooks.constitution_hook import create_constitution_hook
-
-        hook = create_constitution_hook(constitution_path)
-        mock_fn = MagicMock(return_value="unknown_ok")
-
-        result = hook(
-            run_context=mock_run_context_standard,
-            function_name="unknown_tool",
-            function_call=mock_fn,
-            arguments={},
-        )
-        assert result == "unknown_ok"
-        mock_fn.assert_called_once()
-
-    def test_approve_email(
-        self, constitution_path, mock_run_context_standard
-    ):
-        from hooks.constitution_hook import create_constitution_hook
-
-        hook = create_constitution_hook(constitution_path)
-        mock_fn = MagicMock(return_value="email_sent")
-
-        result = hook(
-            run_context=mock_run_context_standard,
-            function_name="send_email",
-            function_call=mock_fn,
-            arguments={"to": "a@b.com", "subject": "Hi", "body": "Hello"},
+
+        hook(result)
+
+        assert len(sent) == 1
+        assert b"3/10" in sent[0]
+
+    def test_binary_result_without_score(self, monkeypatch):
+        # Binary (fast_mode) verdicts carry score=None on failure; the
+        # hook must not compare None against the color threshold.
+        hook, sent = self._make_hook(monkeypatch)
+        result = types.SimpleNamespace(
+            score=None,
+            passed=False,
+            input="Refund $500 for C-1",
+            reason="Tone violates brand voice.",
+            name="Intent Alignment Check",
         )
-        assert result == "email_sent"
-        mock_fn.assert_called_once()
+
+        hook(result)
+
+        assert len(sent) == 1
+        assert b"FAIL" in sent[0]
+        assert b"None/10" not in sent[0]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -165,8 +216,6 @@ class TestIntentRetriever:
     """Test dynamic instruction generation."""
 
     def test_retention_strategy(self):
-        from intent.retriever import create_intent_retriever
-
         retriever = create_intent_retriever(base_intent="Base.")
         result = retriever({"org_goal": "retention", "customer_tier": "standard"})
 
@@ -175,8 +224,6 @@ class TestIntentRetriever:
         assert "standard" in result
 
     def test_cost_reduction_strategy(self):
-        from intent.retriever import create_intent_retriever
-
         retriever = create_intent_retriever(base_intent="Base.")
         result = retriever({"org_goal": "cost_reduction", "customer_tier": "enterprise"})
 
@@ -184,8 +231,6 @@ class TestIntentRetriever:
         assert "enterprise" in result
 
     def test_no_strategy(self):
-        from intent.retriever import create_intent_retriever
-
         retriever = create_intent_retriever(base_intent="Base.")
         result = retriever({"customer_tier": "standard"})
 
@@ -193,8 +238,6 @@ class TestIntentRetriever:
         assert "PRIORITY" not in result
 
     def test_custom_strategy_override(self):
-        from intent.retriever import create_intent_retriever
-
         retriever = create_intent_retriever(
             base_intent="Base.",
             strategy_overrides={"custom_mode": "\nCUSTOM INSTRUCTIONS HERE."},
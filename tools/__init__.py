@@ -1,10 +1,8 @@
 # tools/__init__.py
-from .demo_tools import (
-    cancel_subscription,
-    process_chargeback,
-    send_email,
-    stripe_refund,
-)
+#
+# Lazy re-exports (PEP 562): each @tool decoration runs schema
+# introspection at import time, so importing this package stays free
+# until a tool is actually accessed.
 
 __all__ = [
     "cancel_subscription",
@@ -12,3 +10,11 @@ __all__ = [
     "send_email",
     "stripe_refund",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import demo_tools
+
+        return getattr(demo_tools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,6 +14,19 @@ from agno.tools import tool
 
 logger = logging.getLogger("intent_governance.tools")
 
+# Confirmation skeletons as module constants — per call the tools only
+# pay a single C-level str.format over the precompiled template.
+_REFUND_TPL = (
+    "✅ Refund of ${amount:.2f} processed for customer {cust}. "
+    "Stripe transaction ID: txn_sim_{suffix}_{cents}"
+)
+_EMAIL_TPL = "✅ Email sent to {to} — subject: '{subject}'"
+_CANCEL_TPL = "✅ Subscription cancelled for customer {cust}."
+_CHARGEBACK_TPL = (
+    "⚠️  Chargeback of ${amount:.2f} processed for customer {cust}. "
+    "This action is irreversible."
+)
+
 
 # ── standard tools (governed by constitution hook) ───────────────────────────
 
@@ -29,10 +42,13 @@ def stripe_refund(customer_id: str, amount: float) -> str:
     Returns:
         Confirmation message with the refund details.
     """
-    logger.info("stripe_refund executed: customer=%s amount=%.2f", customer_id, amount)
-    return (
-        f"✅ Refund of ${amount:.2f} processed for customer {customer_id}. "
-        f"Stripe transaction ID: txn_sim_{customer_id[-4:]}_{int(amount*100)}"
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("stripe_refund executed: customer=%s amount=%.2f", customer_id, amount)
+    return _REFUND_TPL.format(
+        amount=amount,
+        cust=customer_id,
+        suffix=customer_id[-4:],
+        cents=round(amount * 100),
     )
 
 
@@ -49,8 +65,9 @@ def send_email(to: str, subject: str, body: str) -> str:
     Returns:
         Confirmation that the email was sent.
     """
-    logger.info("send_email executed: to=%s subject=%s", to, subject)
-    return f"✅ Email sent to {to} — subject: '{subject}'"
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("send_email executed: to=%s subject=%s", to, subject)
+    return _EMAIL_TPL.format(to=to, subject=subject)
 
 
 @tool
@@ -64,8 +81,9 @@ def cancel_subscription(customer_id: str) -> str:
     Returns:
         Confirmation message.
     """
-    logger.info("cancel_subscription executed: customer=%s", customer_id)
-    return f"✅ Subscription cancelled for customer {customer_id}."
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("cancel_subscription executed: customer=%s", customer_id)
+    return _CANCEL_TPL.format(cust=customer_id)
 
 
 # ── human-gated tool (requires_confirmation) ─────────────────────────────────
@@ -83,12 +101,10 @@ def process_chargeback(customer_id: str, amount: float) -> str:
     Returns:
         Confirmation message.
     """
-    logger.info(
-        "process_chargeback executed: customer=%s amount=%.2f",
-        customer_id,
-        amount,
-    )
-    return (
-        f"⚠️  Chargeback of ${amount:.2f} processed for customer {customer_id}. "
-        f"This action is irreversible."
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "process_chargeback executed: customer=%s amount=%.2f",
+            customer_id,
+            amount,
+        )
+    return _CHARGEBACK_TPL.format(amount=amount, cust=customer_id)